@@ -3,17 +3,12 @@
 See: https://www.sphinx-doc.org/en/master/usage/configuration.html
 """
 
-import sys
 from datetime import datetime
-from pathlib import Path
 
 import pyvista
 
 import eeg_positions
 
-curdir = Path(__file__).parent
-sys.path.append((curdir.parent / "eeg_positions").resolve().as_posix())
-
 # see: https://sphinx.readthedocs.io/en/1.3/extensions.html
 extensions = [
     "sphinx.ext.githubpages",
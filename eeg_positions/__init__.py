@@ -1,12 +1,16 @@
 """Compute and plot standard EEG electrode positions."""
 
-from eeg_positions.compute import (
-    get_alias_mapping,
-    get_available_elec_names,
-    get_elec_coords,
-)
-from eeg_positions.utils import find_point_at_fraction
-from eeg_positions.viz import plot_coords
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from eeg_positions.compute import (
+        get_alias_mapping,
+        get_available_elec_names,
+        get_elec_coords,
+    )
+    from eeg_positions.utils import find_point_at_fraction
+    from eeg_positions.viz import plot_coords
 
 __all__ = (
     "find_point_at_fraction",
@@ -16,6 +20,38 @@ __all__ = (
     "plot_coords",
 )
 
+# The public API is imported lazily (see PEP 562), so that for example
+# matplotlib is only imported once `plot_coords` is actually accessed.
+_SUBMODULE_ATTRS = {
+    "compute": ["get_alias_mapping", "get_available_elec_names", "get_elec_coords"],
+    "utils": ["find_point_at_fraction"],
+    "viz": ["plot_coords"],
+}
+_ATTR_TO_SUBMODULE = {
+    attr: submodule for submodule, attrs in _SUBMODULE_ATTRS.items() for attr in attrs
+}
+# submodules that were bound on the package by the former eager imports
+_SUBMODULES = ("compute", "config", "utils", "viz")
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    submodule = _ATTR_TO_SUBMODULE.get(name, None)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    attr = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    # cache the attribute, so that __getattr__ is not called again
+    globals()[name] = attr
+    return attr
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_SUBMODULES))
+
+
 try:
     from importlib.metadata import version
 
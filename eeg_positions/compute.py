@@ -1,6 +1,7 @@
 """Calculate standard EEG electrode positions on a sphere."""
 
 import ast
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
@@ -17,53 +18,41 @@ from eeg_positions.config import (
 )
 from eeg_positions.utils import (
     _add_points_along_contour,
-    _append_ps_to_df,
+    _append_ps,
+    _find_points_at_fractions,
     _stereographic_projection,
-    find_point_at_fraction,
 )
 
+# the labels in each system, including the anatomical landmarks
+_SYSTEM_LABELS = {
+    "1020": frozenset(SYSTEM1020 + LANDMARKS),
+    "1010": frozenset(SYSTEM1010 + LANDMARKS),
+    "1005": frozenset(SYSTEM1005 + LANDMARKS),
+}
 
-def get_alias_mapping():
-    """Get a mapping from electrode names to their aliases.
+# the anatomical landmarks, which are not electrode positions
+_LANDMARK_SET = frozenset(LANDMARKS)
 
-    Some electrode positions have multiple names (aliases), depending
-    on the convention that was used to name them.
-    With this function, electrodes that are typically not part of the
-    10-20, 10-10, or 10-05 namespace are mapped to their alias within
-    these systems.
 
-    Returns
-    -------
-    alias_mapping : dict
-        A dictionary mapping electrode names to a list of alias
-        names. The keys are electrode names that are *not* in the
-        10-05 namespace, but they map to values that *are* in that
-        namespace. However, see also "Notes" below.
+# electrode names that are not in the 10-05 namespace, mapped to their alias
+_ALIAS_MAPPING = dict(
+    A1="LPA+(-0.1, -0.01, -0.01)",
+    A2="RPA+(0.1, -0.01, -0.01)",
+    M1="TP9",
+    M2="TP10",
+)
 
-    Notes
-    -----
-    Some electrodes do not have a direct alias but an approximately
-    corresponding position. For example "A1" corresponds to the
-    "LPA" position with some (x, y, z) offset in the coordinate
-    system. These positions are returned with a mapping like:
-    ``{"name": "alias+(x, y, z)"}``.
 
-    Examples
-    --------
-    >>> alias_mapping = get_alias_mapping()
-    >>> alias_mapping["M1"]
-    'TP9'
-    >>> alias_mapping["A1"]
-    'LPA+(-0.1, -0.01, -0.01)'
+def _check_alias_mapping(alias_mapping):
+    """Check that the alias mapping is consistent.
 
-    """
-    alias_mapping = dict(
-        A1="LPA+(-0.1, -0.01, -0.01)",
-        A2="RPA+(0.1, -0.01, -0.01)",
-        M1="TP9",
-        M2="TP10",
-    )
+    Parameters
+    ----------
+    alias_mapping : dict
+        The mapping from electrode names to their aliases,
+        see :func:`get_alias_mapping`.
 
+    """
     # sanity checks
     for key, val in alias_mapping.items():
         # a value must not be a key
@@ -94,7 +83,60 @@ def get_alias_mapping():
             name = val
         assert name in (SYSTEM1005 + LANDMARKS)
 
-    return alias_mapping
+
+# check once on import, instead of on each call to get_alias_mapping
+_check_alias_mapping(_ALIAS_MAPPING)
+
+# all electrode names for which positions are available
+_AVAILABLE_ELEC_NAMES_ALL = SYSTEM1005 + LANDMARKS + list(_ALIAS_MAPPING.keys())
+_AVAILABLE_ELEC_NAMES_SET = frozenset(_AVAILABLE_ELEC_NAMES_ALL)
+
+# known locations on the unit sphere: front, right, back, left, and top,
+# where the first four lie on the equator
+_SEED_XYZ = (
+    (0.0, 1.0, 0.0),
+    (1.0, 0.0, 0.0),
+    (0.0, -1.0, 0.0),
+    (-1.0, 0.0, 0.0),
+    (0.0, 0.0, 1.0),
+)
+
+
+def get_alias_mapping():
+    """Get a mapping from electrode names to their aliases.
+
+    Some electrode positions have multiple names (aliases), depending
+    on the convention that was used to name them.
+    With this function, electrodes that are typically not part of the
+    10-20, 10-10, or 10-05 namespace are mapped to their alias within
+    these systems.
+
+    Returns
+    -------
+    alias_mapping : dict
+        A dictionary mapping electrode names to a list of alias
+        names. The keys are electrode names that are *not* in the
+        10-05 namespace, but they map to values that *are* in that
+        namespace. However, see also "Notes" below.
+
+    Notes
+    -----
+    Some electrodes do not have a direct alias but an approximately
+    corresponding position. For example "A1" corresponds to the
+    "LPA" position with some (x, y, z) offset in the coordinate
+    system. These positions are returned with a mapping like:
+    ``{"name": "alias+(x, y, z)"}``.
+
+    Examples
+    --------
+    >>> alias_mapping = get_alias_mapping()
+    >>> alias_mapping["M1"]
+    'TP9'
+    >>> alias_mapping["A1"]
+    'LPA+(-0.1, -0.01, -0.01)'
+
+    """
+    return dict(_ALIAS_MAPPING)
 
 
 def get_available_elec_names(system="all"):
@@ -135,7 +177,7 @@ def get_available_elec_names(system="all"):
         "1010": SYSTEM1010,
         "1005": SYSTEM1005,
         "landmarks": LANDMARKS,
-        "all": (SYSTEM1005 + LANDMARKS + list(get_alias_mapping().keys())),
+        "all": list(_AVAILABLE_ELEC_NAMES_ALL),
     }
     elec_names = elec_names.get(system, None)
     if elec_names is None:
@@ -277,18 +319,15 @@ def get_elec_coords(
     if equator not in ACCEPTED_EQUATORS:
         raise ValueError(f"`equator` must be one of {ACCEPTED_EQUATORS}.")
 
-    systems = {"1020": SYSTEM1020, "1010": SYSTEM1010, "1005": SYSTEM1005}
-    system = systems.get(system, None)
-    if system is None:
-        raise ValueError(f"`system` must be one of {list(systems.keys())}.")
+    if system not in _SYSTEM_LABELS:
+        raise ValueError(f"`system` must be one of {list(_SYSTEM_LABELS.keys())}.")
 
     if elec_names is None:
         elec_names = []
     if not isinstance(elec_names, (list, type(None))):
         raise ValueError("`elec_names` must be a list of str or None.")
 
-    available_elec_names = get_available_elec_names()
-    bad_elec_names = set(elec_names) - set(available_elec_names)
+    bad_elec_names = set(elec_names) - _AVAILABLE_ELEC_NAMES_SET
     if len(bad_elec_names) > 0:
         msg = (
             f"For some `elec_names` there are no available positions: {bad_elec_names}"
@@ -307,6 +346,71 @@ def get_elec_coords(
         if not isinstance(val, bool):
             raise ValueError(f"`{name}` must be a boolean value, but found: {val}")
 
+    # return as mne DigMontage object (or not)
+    # ----------------------------------------
+    if as_mne_montage:
+        labels, xyz = _select_positions(system, elec_names, equator, sort)
+
+        # check that we have an appropriate version
+        try:
+            import mne
+        except ImportError:
+            raise ImportError(
+                "if `as_mne_montage` is True, you must have mne installed."
+            )
+
+        # now convert to DigMontage
+        # NOTE: set to MNE default head size radius (in meters)
+        xyz = xyz * mne.defaults.HEAD_SIZE_DEFAULT
+        ch_pos = {
+            label: pos
+            for label, pos in zip(labels, xyz)
+            # landmarks are not electrode positions
+            if label not in _LANDMARK_SET
+        }
+
+        # based on our assumptions: Nz=NAS, T9=LPA, T10=RPA
+        _, xyz_all, label_to_idx = _get_positions(equator)
+        NAS, LPA, RPA = (
+            xyz_all[[label_to_idx["NAS"], label_to_idx["LPA"], label_to_idx["RPA"]]]
+            * mne.defaults.HEAD_SIZE_DEFAULT
+        )
+
+        coords = mne.channels.make_dig_montage(
+            ch_pos=ch_pos, nasion=NAS, lpa=LPA, rpa=RPA, coord_frame="head"
+        )
+
+        # return early
+        return coords
+
+    # the coordinates only depend on the arguments, so they are cached
+    coords = _get_coords(system, tuple(elec_names), drop_landmarks, dim, equator, sort)
+    return coords.copy()
+
+
+def _select_positions(system, elec_names, equator, sort):
+    """Select electrode positions by system or name, handling aliases.
+
+    Parameters
+    ----------
+    system : "1020" | "1010" | "1005"
+        The system from which to select positions if `elec_names` is empty.
+    elec_names : list of str | tuple of str
+        The electrode names for which to select positions, including aliases.
+    equator : "Nz-T10-Iz-T9" | "Fpz-T8-Oz-T7"
+        Which contour line of electrodes lies at the equator of the sphere.
+    sort : bool
+        If True, the selected positions are ordered as in :func:`_get_positions`
+        instead of as in `elec_names`.
+
+    Returns
+    -------
+    labels : list of str
+        The labels of the selected positions, without duplicates.
+    xyz : np.ndarray, shape (n_labels, 3)
+        The x, y, z coordinates of the selected positions.
+
+    """
     # handle aliases
     # --------------
     # get dict of aliases
@@ -320,14 +424,17 @@ def get_elec_coords(
     # names back to what the users wants
     elec_names_replaced = {}
     elec_names_replaced_special = {}
+    requested_elec_names = set(elec_names)
+    renamed_elec_names = []
     for name in elec_names:
-        # skip all elec_names that are not aliases: These are fine as they are
+        # keep all elec_names that are not aliases: These are fine as they are
         if name not in alias_mapping:
+            renamed_elec_names.append(name)
             continue
 
         # check that one position is not specified twice
         alias = alias_mapping[name]
-        if alias in elec_names:
+        if alias in requested_elec_names:
             msg = (
                 f"You specified the same electrode position using two aliases: "
                 f"{name}, {alias}. Remove one of them from `elec_names`."
@@ -337,33 +444,133 @@ def get_elec_coords(
         # replace the elec_name with its alias
         if "+(" not in alias:
             # for simple cases we know that an alias is in the 10-05 namespace
-            elec_names[elec_names.index(name)] = alias
+            renamed_elec_names.append(alias)
             elec_names_replaced[alias] = name
         else:
             # however, some cases are specified using an "alias+(x, y, z)" format
             # we compute these electrodes as the last positions (special treatment)
             assert "+(" in alias
+            renamed_elec_names.append(name)
             elec_names_special.append(alias)
             alias_name, _ = alias.split("+")
             elec_names_replaced_special[alias_name] = name
 
-    # calculate positions
-    # -------------------
+    # do not modify the list that was passed by the user
+    elec_names = renamed_elec_names
+
+    # get positions
+    # -------------
+    # positions only depend on the equator, so they are computed once and cached
+    labels_all, xyz_all, label_to_idx = _get_positions(equator)
+
+    # subselect electrodes
+    # --------------------
+    if len(elec_names) > 0:
+        # special elec positions are not yet in `label_to_idx`, they are added below
+        idx = [label_to_idx[name] for name in elec_names if name in label_to_idx]
+        if sort:
+            # the order is based on the positions instead of `elec_names`
+            idx = sorted(set(idx))
+    else:
+        system_labels = _SYSTEM_LABELS[system]
+        idx = [i for i, label in enumerate(labels_all) if label in system_labels]
+
+    labels = [labels_all[i] for i in idx]
+    xyz = xyz_all[idx]
+
+    # add special elec positions, re-naming their aliases
+    # (the same special position may be requested several times)
+    modifiers = {}
+    xyz_to_add = []
+    for elec in elec_names_special:
+        name, modifier_str = elec.split("+")
+        if modifier_str not in modifiers:
+            modifiers[modifier_str] = np.array(ast.literal_eval(modifier_str))
+        labels.append(elec_names_replaced_special[name])
+        xyz_to_add.append(xyz_all[label_to_idx[name]] + modifiers[modifier_str])
+
+    if len(xyz_to_add) > 0:
+        xyz = np.vstack([xyz] + xyz_to_add)
+
+    # re-rename remaining aliases
+    labels = [elec_names_replaced.get(label, label) for label in labels]
+
+    # drop potential duplicates, keeping the last occurrence of each label
+    last_idx = {label: i for i, label in enumerate(labels)}
+    if len(last_idx) < len(labels):
+        idx = sorted(last_idx.values())
+        labels = [labels[i] for i in idx]
+        xyz = xyz[idx]
+
+    return labels, xyz
+
+
+@lru_cache(maxsize=64)
+def _get_coords(system, elec_names, drop_landmarks, dim, equator, sort):
+    """Get electrode coordinates as a DataFrame.
+
+    See :func:`get_elec_coords` for a description of the parameters, which
+    must be hashable (i.e., `elec_names` must be a tuple). The result is
+    cached, so it must not be modified in place.
+
+    """
+    labels, xyz = _select_positions(system, elec_names, equator, sort)
+
+    # drop landmarks (or not)
+    # -----------------------
+    if drop_landmarks:
+        idx = [i for i, label in enumerate(labels) if label not in _LANDMARK_SET]
+        labels = [labels[i] for i in idx]
+        xyz = xyz[idx]
+
+    # sort alphabetically (or not)
+    # ----------------------------
+    if sort:
+        # labels are unique, so the sort is unambiguous
+        idx = sorted(range(len(labels)), key=labels.__getitem__)
+        labels = [labels[i] for i in idx]
+        xyz = xyz[idx]
+
+    # project to 2d (or not)
+    # ----------------------
+    # the dtype of "label" must be specified in case no positions are left
+    data = {"label": pd.Series(labels, dtype=str), "x": xyz[:, 0], "y": xyz[:, 1]}
+    if dim == "2d":
+        data["x"], data["y"] = _stereographic_projection(
+            xyz[:, 0], xyz[:, 1], xyz[:, 2]
+        )
+    else:
+        data["z"] = xyz[:, 2]
+
+    coords = pd.DataFrame(data)
+    return coords
+
+
+@lru_cache(maxsize=len(ACCEPTED_EQUATORS))
+def _get_positions(equator):
+    """Compute all electrode and landmark positions on a sphere.
+
+    Parameters
+    ----------
+    equator : "Nz-T10-Iz-T9" | "Fpz-T8-Oz-T7"
+        Which contour line of electrodes lies at the equator of the sphere.
+
+    Returns
+    -------
+    labels : tuple of str
+        The labels of all positions, including the anatomical landmarks.
+    xyz : np.ndarray, shape (n_labels, 3)
+        The x, y, z coordinates of all positions, in the order of `labels`.
+        The array is read-only, because the result is cached.
+    label_to_idx : dict
+        Mapping each label to its row in `xyz`. The result is cached,
+        so it must not be modified in place.
+
+    """
     # known locations
-    front = (0.0, 1.0, 0.0)
-    right = (1.0, 0.0, 0.0)
-    back = (0.0, -1.0, 0.0)
-    left = (-1.0, 0.0, 0.0)
-    top = (0.0, 0.0, 1.0)
-
-    d = {
-        "label": equator.split("-") + ["Cz"],
-        "x": [front[0], right[0], back[0], left[0], top[0]],
-        "y": [front[1], right[1], back[1], left[1], top[1]],
-        "z": [front[2], right[2], back[2], left[2], top[2]],
-    }
+    front, right, back, left, top = _SEED_XYZ
 
-    df = pd.DataFrame.from_dict(d)
+    positions = dict(zip(equator.split("-") + ["Cz"], _SEED_XYZ))
 
     # check the order of contours to draw based on known locations
     if equator == "Nz-T10-Iz-T9":
@@ -375,147 +582,49 @@ def get_elec_coords(
 
     # draw everything that we can draw
     for contour in contour_order:
-        df = _add_points_along_contour(df, contour)
+        _add_points_along_contour(positions, contour)
 
     # for the Fpz equator, we need to compute some points "manually"
     # before drawing final contours
     if equator == "Fpz-T8-Oz-T7":
         frac_modifier = 1 / len(CONTOUR_ORDER_Fpz_EQUATOR[0])
+        fracs = 1 + np.array([1, 2]) * frac_modifier
+        p_arcs = {
+            ("OIz", "Iz"): (front, top, back),
+            ("NFpz", "Nz"): (back, top, front),
+            ("T10h", "T10"): (left, top, right),
+            ("T9h", "T9"): (right, top, left),
+        }
+
+        # extend each arc beyond its end by one and two steps
         other_ps = {}
-        p_to_find = ["OIz", "Iz", "NFpz", "Nz", "T10h", "T10", "T9h", "T9"]
-        p_fracs = [1, 2, 1, 2, 1, 2, 1, 2]
-        p_arc = (
-            [(front, top, back)] * 2
-            + [(back, top, front)] * 2
-            + [(left, top, right)] * 2
-            + [(right, top, left)][::-1] * 2
-        )
-
-        for label, frac, arc in zip(p_to_find, p_fracs, p_arc):
-            other_ps[label] = find_point_at_fraction(
-                *arc, frac=1 + (frac * frac_modifier)
-            )
+        for p_to_find, arc in p_arcs.items():
+            points = _find_points_at_fractions(*arc, fracs)
+            other_ps.update(zip(p_to_find, map(tuple, points)))
 
-        # append to data frame
-        df = _append_ps_to_df(df, other_ps)
+        # add to positions
+        _append_ps(positions, other_ps)
 
         # draw final contours for Fpz equator
         for contour in contour_order_late:
-            df = _add_points_along_contour(df, contour)
+            _add_points_along_contour(positions, contour)
 
     # get landmark coordinates
     # ------------------------
     # based on our assumptions: Nz=NAS, T9=LPA, T10=RPA
-    tmp = df.loc[df["label"].isin(["Nz", "T9", "T10"]), :].copy()
-    tmp.loc[:, "label"] = tmp["label"].replace(
-        to_replace=dict(Nz="NAS", T9="LPA", T10="RPA")
-    )
-    df = pd.concat([df, tmp], ignore_index=True)
-
-    # if we need to return an mne montage, we need the actual coordinates
-    # as ndarrays
-    if as_mne_montage:
-        # based on our assumptions: Nz=NAS, T9=LPA, T10=RPA
-        landmark_pos = df.set_index("label").to_dict("index")
-        for label in ["NAS", "LPA", "RPA"]:
-            landmark_pos[label] = np.asarray(list(landmark_pos[label].values()))
-
-    # subselect electrodes
-    # --------------------
-    if len(elec_names) > 0:
-        selection = df.label.isin(elec_names)
-        df_selection = df.loc[selection, :].copy()
-        if not sort:
-            df_selection = (
-                df_selection.set_index("label").reindex(elec_names).reset_index()
-            )
-    else:
-        selection = df.label.isin(system + LANDMARKS)
-        df_selection = df.loc[selection, :].copy()
-
-    # add special elec positions
-    pos_to_add = {}
-    for elec in elec_names_special:
-        name, modifier_str = elec.split("+")
-        modifier = np.array(ast.literal_eval(modifier_str))
-        original = df.loc[df["label"] == name, ["x", "y", "z"]].to_numpy()
-        x, y, z = np.squeeze(original + modifier)
-
-        for col, val in zip(["label", "x", "y", "z"], [name, x, y, z]):
-            pos_to_add[col] = pos_to_add.get(col, []) + [val]
-
-    # re-name aliases of special elec positions, then add
-    pos_to_add_df = pd.DataFrame.from_dict(pos_to_add)
-    if len(pos_to_add_df) > 0:
-        pos_to_add_df.loc[:, "label"] = pos_to_add_df["label"].replace(
-            to_replace=elec_names_replaced_special
-        )
-        df_selection = pd.concat([df_selection, pos_to_add_df], ignore_index=True)
-
-    # re-rename remaining aliases
-    df_selection.loc[:, "label"] = df_selection["label"].replace(
-        to_replace=elec_names_replaced
-    )
-
-    # return as mne DigMontage object (or not)
-    # ----------------------------------------
-    if as_mne_montage:
-        # check that we have an appropriate version
-        try:
-            import mne
-        except ImportError:
-            raise ImportError(
-                "if `as_mne_montage` is True, you must have mne installed."
-            )
-
-        # now convert to DigMontage
-        # NOTE: set to MNE default head size radius (in meters)
-        # drop potential duplicates first
-        df_selection = df_selection.drop_duplicates(subset=["label"], keep="last")
-        ch_pos_from_df = df_selection.set_index("label").to_dict("index")
-        ch_pos = {}
-        for key, val in ch_pos_from_df.items():
-            if key in ["NAS", "LPA", "RPA"]:
-                # landmarks are not electrode positions
-                continue
-
-            ch_pos[key] = (
-                np.asarray(list(val.values())) * mne.defaults.HEAD_SIZE_DEFAULT
-            )
-
-        NAS = landmark_pos["NAS"] * mne.defaults.HEAD_SIZE_DEFAULT
-        LPA = landmark_pos["LPA"] * mne.defaults.HEAD_SIZE_DEFAULT
-        RPA = landmark_pos["RPA"] * mne.defaults.HEAD_SIZE_DEFAULT
-
-        coords = mne.channels.make_dig_montage(
-            ch_pos=ch_pos, nasion=NAS, lpa=LPA, rpa=RPA, coord_frame="head"
-        )
-
-        # return early
-        return coords
-
-    # drop landmarks (or not)
-    # -----------------------
-    if drop_landmarks:
-        df_selection = df_selection[~df_selection["label"].isin(["NAS", "LPA", "RPA"])]
-
-    # project to 2d (or not)
-    # ----------------------
-    if dim == "2d":
-        xs, ys = _stereographic_projection(
-            df_selection["x"].to_numpy(),
-            df_selection["y"].to_numpy(),
-            df_selection["z"].to_numpy(),
-        )
-        df_selection = df_selection.loc[:, ["label", "x", "y"]]
-        df_selection.loc[:, "x"] = xs
-        df_selection.loc[:, "y"] = ys
+    landmark_mapping = dict(Nz="NAS", T9="LPA", T10="RPA")
+    landmarks = {
+        landmark_mapping[label]: point
+        for label, point in positions.items()
+        if label in landmark_mapping
+    }
+    positions.update(landmarks)
 
-    df_selection = df_selection.drop_duplicates(subset=["label"], keep="last")
-    if sort:
-        df_selection = df_selection.sort_values(by="label")
-    coords = df_selection.reset_index(drop=True)
-    return coords
+    labels = tuple(positions.keys())
+    xyz = np.array(list(positions.values()))
+    xyz.flags.writeable = False
+    label_to_idx = {label: i for i, label in enumerate(labels)}
+    return labels, xyz, label_to_idx
 
 
 def _produce_files_and_do_x(x="save"):
@@ -537,10 +646,14 @@ def _produce_files_and_do_x(x="save"):
     """
     # which decimal precision to use for saving the data
     precision = 4
+    float_fmt = f"%.{precision}f"
 
     fpath = Path(__file__).resolve().parent / ".." / "data"
     # For each equator for each system for both 2D and 3D
     for equator in ACCEPTED_EQUATORS:
+        if x == "save":
+            (fpath / f"{equator}").mkdir(parents=True, exist_ok=True)
+
         for system in ["1020", "1010", "1005"]:
             for dim in ["2D", "3D"]:
                 coords = get_elec_coords(
@@ -554,21 +667,35 @@ def _produce_files_and_do_x(x="save"):
                 )
 
                 fname = fpath / f"{equator}" / f"standard_{system}_{dim}.tsv"
+                cols = ["x", "y"] if dim == "2D" else ["x", "y", "z"]
 
                 if x == "save":
-                    Path(fname).parent.mkdir(parents=True, exist_ok=True)
-                    coords.to_csv(
+                    # positions are never NaN, so no "n/a" handling is needed
+                    np.savetxt(
                         fname,
-                        sep="\t",
-                        na_rep="n/a",
-                        index=False,
-                        float_format=f"%.{precision}f",
+                        coords[["label"] + cols].to_numpy(dtype=object),
+                        fmt=["%s"] + [float_fmt] * len(cols),
+                        delimiter="\t",
+                        header="\t".join(["label"] + cols),
+                        comments="",
                     )
                 else:
                     assert x == "compare"
-                    coords_read = pd.read_csv(fname, sep="\t")
-                    cols = ["x", "y"] if dim == "2D" else ["x", "y", "z"]
-                    data_read = coords_read[cols]
-                    data_produced = coords[cols].round(precision)
+                    # the first column holds the labels, followed by `cols`
+                    data_read = np.loadtxt(
+                        fname,
+                        delimiter="\t",
+                        skiprows=1,
+                        usecols=range(1, len(cols) + 1),
+                        ndmin=2,
+                    )
+                    data_produced = (
+                        coords[cols].round(precision).to_numpy(dtype=np.float64)
+                    )
 
                     np.testing.assert_allclose(data_read, data_produced)
+
+                    labels_read = np.loadtxt(
+                        fname, dtype=str, delimiter="\t", skiprows=1, usecols=0
+                    )
+                    np.testing.assert_array_equal(labels_read, coords["label"])
@@ -1,7 +1,11 @@
 """Functions to calculate and plot standard EEG electrode position systems."""
 
+import math
+
 import numpy as np
-import pandas as pd
+
+# index of the midpoint of a contour, for each permitted contour length
+_CONTOUR_MIDPOINT_IDX = {17: 8, 21: 10}
 
 
 def find_point_at_fraction(p1, p2, p3, frac):
@@ -54,6 +58,76 @@ def find_point_at_fraction(p1, p2, p3, frac):
     >>> find_point_at_fraction(p1, p2, p3, frac=.3)
     (0.5878, 0.0, 0.809)
 
+    """
+    (xc, yc, zc), (xu, yu, zu), (xv, yv, zv), theta = _get_arc_parameters(p1, p2, p3)
+
+    # Now calculate coordinates at fraction
+    cos_frac_theta = math.cos(frac * theta)
+    sin_frac_theta = math.sin(frac * theta)
+    x = xc + xu * cos_frac_theta + xv * sin_frac_theta
+    y = yc + yu * cos_frac_theta + yv * sin_frac_theta
+    z = zc + zu * cos_frac_theta + zv * sin_frac_theta
+
+    # Round to 4 decimals and collect the points in tuple
+    point = np.asarray((x, y, z))
+    point = tuple(point.round(decimals=4))
+    return point
+
+
+def _find_points_at_fractions(p1, p2, p3, fracs):
+    """Find several points on an arc spanned by three points.
+
+    This is a vectorized version of :func:`find_point_at_fraction`,
+    computing the arc only once for all fractions in `fracs`.
+
+    Parameters
+    ----------
+    p1, p2, p3 : tuple
+        Each tuple containing x, y, z cartesian coordinates.
+    fracs : array-like of float
+        Fractions of distance from `p1` to `p3` over `p2` at which
+        to find coordinates of `points`.
+
+    Returns
+    -------
+    points : np.ndarray, shape (n_fracs, 3)
+        The x, y, z cartesian coordinates of the points at fractions.
+
+    """
+    center, u, v, theta = _get_arc_parameters(p1, p2, p3)
+
+    frac_thetas = np.asarray(fracs, dtype=float)[:, np.newaxis] * theta
+    points = (
+        np.asarray(center)
+        + np.asarray(u) * np.cos(frac_thetas)
+        + np.asarray(v) * np.sin(frac_thetas)
+    )
+
+    # Round to 4 decimals, as in find_point_at_fraction
+    return points.round(decimals=4)
+
+
+def _get_arc_parameters(p1, p2, p3):
+    """Get the circle and plane angle of an arc spanned by three points.
+
+    See :func:`find_point_at_fraction` for the assumptions on the points.
+
+    Parameters
+    ----------
+    p1, p2, p3 : tuple
+        Each tuple containing x, y, z cartesian coordinates.
+
+    Returns
+    -------
+    center : tuple
+        The x, y, z cartesian coordinates of the center of the circle
+        on which the arc lies.
+    u, v : tuple
+        The axes of a 2D coordinate system in the plane of the circle,
+        with `u` pointing towards `p1` and `v` pointing towards `p2`.
+    theta : float
+        The positive plane angle from `p1` to `p3`.
+
     """
     # Unpack the point tuples
     x1, y1, z1 = p1
@@ -62,6 +136,8 @@ def find_point_at_fraction(p1, p2, p3, frac):
 
     # Using the cross product, find unit normal vector (xn, yn, zn)
     # of the plane spanning the three points:
+    # NOTE: the cross products in this function are written out on scalars on
+    # purpose, which is much faster than np.cross for single 3D vectors.
     x12 = x2 - x1
     y12 = y2 - y1
     z12 = z2 - z1
@@ -73,7 +149,7 @@ def find_point_at_fraction(p1, p2, p3, frac):
     yn = z12 * x13 - x12 * z13
     zn = x12 * y13 - y12 * x13
 
-    n = np.sqrt(xn**2 + yn**2 + zn**2)
+    n = math.sqrt(xn**2 + yn**2 + zn**2)
 
     if n <= 0.0:
         raise ValueError("Points are either collinear or share the same coordinates.")
@@ -118,131 +194,69 @@ def find_point_at_fraction(p1, p2, p3, frac):
 
     thetau = xt * xu + yt * yu + zt * zu
     thetav = xt * xv + yt * yv + zt * zv
-    theta = np.arctan2(thetav, thetau)
+    theta = math.atan2(thetav, thetau)
 
     if theta < 0.0:
         # Add 360 degrees, or 2*Pi in radians, to make it positive
-        theta = theta + 2 * np.pi
-
-    # Now calculate coordinates at fraction
-    x = xc + xu * np.cos(frac * theta) + xv * np.sin(frac * theta)
-    y = yc + yu * np.cos(frac * theta) + yv * np.sin(frac * theta)
-    z = zc + zu * np.cos(frac * theta) + zv * np.sin(frac * theta)
+        theta = theta + 2 * math.pi
 
-    # Round to 4 decimals and collect the points in tuple
-    point = np.asarray((x, y, z))
-    point = tuple(point.round(decimals=4))
-    return point
+    return (xc, yc, zc), (xu, yu, zu), (xv, yv, zv), theta
 
 
-def _add_points_along_contour(df, contour):
-    """Compute points along `contour` and add them to `df`.
+def _add_points_along_contour(positions, contour):
+    """Compute points along `contour` and add them to `positions`.
 
     Parameters
     ----------
-    df : pandas.DataFrame
-        The data with columns ["label", "x", "y", "z"].
+    positions : dict
+        Each key is a label, with a tuple value of (x, y, z)
+        coordinates. Points along `contour` are added in place,
+        points that are already in `positions` are kept as they are.
     contour : list of str
         Each entry in `contour` is the label of a point, and
         all points in `contour` are ordered. Must be of length
         17 or 21.
 
-    Returns
-    -------
-    df : pandas.DataFrame
-        The data with columns ["label", "x", "y", "z"] and
-        new points (rows in `df`) along `contour` added.
-
     """
     contour_len = len(contour)
-    if contour_len == 21:
-        midpoint_idx = 10
-    elif contour_len == 17:
-        midpoint_idx = 8
-    else:
+    midpoint_idx = _CONTOUR_MIDPOINT_IDX.get(contour_len, None)
+    if midpoint_idx is None:
         raise ValueError(f"contour must be of len 17 or 21 but is {contour_len}")
 
-    # Get the reference points from data frame
-    p1 = _get_xyz(df, contour[0])
-    p2 = _get_xyz(df, contour[midpoint_idx])
-    p3 = _get_xyz(df, contour[-1])
+    # Get the reference points
+    p1 = positions[contour[0]]
+    p2 = positions[contour[midpoint_idx]]
+    p3 = positions[contour[-1]]
 
-    # Calculate all other points at fractions of distance
-    other_ps = {}
-    for i, label in enumerate(contour):
-        other_ps[label] = find_point_at_fraction(
-            p1, p2, p3, frac=i / (len(contour) - 1)
-        )
+    # Calculate the other points at fractions of distance, skipping points
+    # that are already known, because those are never overwritten
+    missing_idx = [idx for idx, label in enumerate(contour) if label not in positions]
+    fracs = np.asarray(missing_idx) / (contour_len - 1)
+    points = _find_points_at_fractions(p1, p2, p3, fracs)
+    other_ps = {contour[idx]: tuple(point) for idx, point in zip(missing_idx, points)}
 
-    # Append to data frame
-    df = _append_ps_to_df(df, other_ps)
-    return df
+    # Add to positions
+    _append_ps(positions, other_ps)
 
 
-def _append_ps_to_df(df, ps):
-    """Add points `ps` to data frame `df`.
+def _append_ps(positions, ps):
+    """Add points `ps` to `positions`.
 
-    This function removes duplicates from `df`, always keeping
-    the first entry it finds.
+    Points that are already in `positions` are not overwritten,
+    always keeping the first entry.
 
     Parameters
     ----------
-    df : pandas.DataFrame
-        The data with columns ["label", "x", "y", "z"].
+    positions : dict
+        Each key is a label, with a tuple value of (x, y, z)
+        coordinates. `ps` are added in place.
     ps : dict
         Each key is a label, with a tuple value of (x, y, z)
         coordinates.
 
-    Returns
-    -------
-    df : pandas.DataFrame
-        The data with columns ["label", "x", "y", "z"],
-        and `ps` added.
-
-    """
-    tmp = pd.DataFrame.from_dict(ps, orient="index")
-    tmp.columns = ["x", "y", "z"]
-    tmp["label"] = tmp.index
-    df = pd.concat([df, tmp], ignore_index=True)
-
-    # Remove duplicates, keeping the first computations
-    df = df.drop_duplicates(subset="label", keep="first")
-    return df
-
-
-# Convenient helper function to access xyz coordinates from df
-def _get_xyz(df, label):
-    """Get xyz coordinates from a pandas data frame.
-
-    Parameters
-    ----------
-    df : pandas.DataFrame
-        Data frame with (at least) columns x, y, z, label.
-    label : str
-        Electrode label for which to get x, y, z from `df`.
-
-    Returns
-    -------
-    x, y, z : float
-        Positions of electrodes on a unit sphere.
-
     """
-    # Check that all labels are present
-    for var in ["label", "x", "y", "z"]:
-        if var not in df.columns:
-            raise ValueError(f"df must contain a column '{var}'")
-
-    # Check we get exactly one row of data
-    subdf = df[df["label"] == label]
-    nrows = subdf.shape[0]
-    if nrows == 0 or nrows > 1:
-        raise ValueError(f"Expected one row of data but got: {nrows}")
-
-    # Get the data
-    x = float(df[df["label"] == label]["x"].iloc[0])
-    y = float(df[df["label"] == label]["y"].iloc[0])
-    z = float(df[df["label"] == label]["z"].iloc[0])
-    return x, y, z
+    for label, point in ps.items():
+        positions.setdefault(label, point)
 
 
 def _get_coords_on_circle(cx=0, cy=0, r=1, steps=180 / 20):
@@ -272,15 +286,13 @@ def _get_coords_on_circle(cx=0, cy=0, r=1, steps=180 / 20):
     assert steps / int(steps) == 1.0
     steps = int(steps)
 
-    coords = []
-    for a in np.arange(0, 360, steps):
-        x = cx + r * np.cos(np.deg2rad(a))
-        y = cy + r * np.sin(np.deg2rad(a))
-        coords.append([x, y])
+    angles = np.deg2rad(np.arange(0, 360, steps))
+    x = cx + r * np.cos(angles)
+    y = cy + r * np.sin(angles)
 
     # Exchange x and y so that 0 degree is top of circle
     # also round off
-    coords = [[round(y, 5), round(x, 5)] for x, y in coords]  # noqa
+    coords = np.stack([y, x], axis=1).round(decimals=5).tolist()
 
     return coords
 
@@ -294,12 +306,14 @@ def _stereographic_projection(x, y, z, scale=1.0):
     on the sphere's North pole ``(0, 0, 1)``. The resulting
     point is ``p' = (x', y')``.
 
-    ``x', y' = (1 / (x + z)), (1 / (y + z))``
+    ``x', y' = x / (1 + z), y / (1 + z)``
 
     Parameters
     ----------
-    x, y, z : float
-        Positions of electrodes on a unit sphere
+    x, y, z : float | array-like of float
+        Positions of electrodes on a unit sphere. All electrodes
+        should be passed at once as arrays, instead of calling this
+        function for each electrode.
     scale : float
         Determines the distance of the projection point
         from the origin of the sphere in terms of the radius.
@@ -307,11 +321,12 @@ def _stereographic_projection(x, y, z, scale=1.0):
 
     Returns
     -------
-    x, y : float
-        Positions of electrodes as projected onto a unit circle.
+    x, y : np.ndarray
+        Positions of electrodes as projected onto a unit circle,
+        with the same shape as the input.
 
     """
+    # work on plain arrays, so that pandas objects are converted only once
+    x, y, z = (np.asarray(val, dtype=float) for val in (x, y, z))
     mu = 1.0 / (scale + z)
-    x = x * mu
-    y = y * mu
-    return np.asarray(x), np.asarray(y)
+    return x * mu, y * mu
@@ -1,6 +1,7 @@
 """Visualization utilities."""
 
-import matplotlib.pyplot as plt
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
 
@@ -19,6 +20,9 @@ def _plot_spherical_head():
         The Axes object.
 
     """
+    import matplotlib.pyplot as plt
+    from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
     # Start new 3D figure
     fig = plt.figure()
     ax = fig.add_subplot(111, projection="3d")
@@ -27,36 +31,23 @@ def _plot_spherical_head():
     ax.set_xlabel("x", fontsize=20)
     ax.set_ylabel("y", fontsize=20)
     ax.set_zlabel("z", fontsize=20)
-    ax.set_aspect("auto")
     ax.set_xlim((-1, 1))
     ax.set_ylim((-1, 1))
     ax.set_zlim((-1, 1))
 
     # No background
     ax.grid(False)
-    ax.xaxis.pane.fill = False
-    ax.yaxis.pane.fill = False
-    ax.zaxis.pane.fill = False
-    ax.xaxis.pane.set_edgecolor("w")
-    ax.yaxis.pane.set_edgecolor("w")
-    ax.zaxis.pane.set_edgecolor("w")
-
-    # Plot origin
-    max_lim = np.max(np.abs([ax.get_xlim3d(), ax.get_ylim3d(), ax.get_zlim3d()]))
-    n_pts = 11
-    fake_spine = np.linspace(-max_lim * 6, max_lim * 6, n_pts)
-    fake_spine_zeros = np.zeros_like(fake_spine)
+    for axis in (ax.xaxis, ax.yaxis, ax.zaxis):
+        axis.pane.fill = False
+        axis.pane.set_edgecolor("w")
 
-    ax.plot(fake_spine, fake_spine_zeros, fake_spine_zeros, color="k")
-    ax.plot(fake_spine_zeros, fake_spine, fake_spine_zeros, color="k")
-    ax.plot(fake_spine_zeros, fake_spine_zeros, fake_spine, color="k")
+    # Plot origin, with the x, y, and z spines as one collection
+    max_lim = np.max(np.abs([ax.get_xlim3d(), ax.get_ylim3d(), ax.get_zlim3d()]))
+    fake_spines = max_lim * 6 * np.stack([-np.eye(3), np.eye(3)], axis=1)
+    ax.add_collection3d(Line3DCollection(fake_spines, colors="k"))
 
     # draw spherical head
-    resolution = 100j
-    u, v = np.mgrid[0 : 2 * np.pi : resolution, 0 : np.pi : resolution]
-    x = np.cos(u) * np.sin(v)
-    y = np.sin(u) * np.sin(v)
-    z = np.cos(v)
+    x, y, z = _get_sphere_mesh()
     ax.plot_wireframe(x, y, z, color="k", linestyle=":", alpha=0.1)
     ax.plot_surface(x, y, z, color="k", alpha=0.1)
     ax.set_box_aspect((1, 1, 1))
@@ -64,6 +55,37 @@ def _plot_spherical_head():
     return fig, ax
 
 
+@lru_cache(maxsize=1)
+def _get_sphere_mesh(resolution=40):
+    """Get a mesh of points on the unit sphere.
+
+    Parameters
+    ----------
+    resolution : int
+        The number of points along each of the two angles of the mesh.
+        Defaults to 40, which is visually indistinguishable from finer meshes
+        at the low opacity used for the head, but much faster to draw.
+
+    Returns
+    -------
+    x, y, z : np.ndarray, shape (resolution, resolution)
+        The cartesian coordinates of the mesh points. The result is cached,
+        so the arrays are read-only.
+
+    """
+    # evaluate the trigonometric functions on the 1D angles only,
+    # then form the mesh via outer products
+    u = np.linspace(0, 2 * np.pi, resolution)
+    v = np.linspace(0, np.pi, resolution)
+    sin_v = np.sin(v)
+    x = np.multiply.outer(np.cos(u), sin_v)
+    y = np.multiply.outer(np.sin(u), sin_v)
+    z = np.broadcast_to(np.cos(v), (resolution, resolution))
+    for arr in (x, y, z):
+        arr.flags.writeable = False
+    return x, y, z
+
+
 def _plot_2d_head(radius_inner_contour=None, show_axis=False):
     """Plot a head in 2D.
 
@@ -85,6 +107,8 @@ def _plot_2d_head(radius_inner_contour=None, show_axis=False):
         The Axes object.
 
     """
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots()
     ax.axes.set_aspect("equal")
     plt.xlabel("x")
@@ -107,8 +131,9 @@ def _plot_2d_head(radius_inner_contour=None, show_axis=False):
 
     # Draw nose
     nose_width = 5
-    nose_base_l = _get_coords_on_circle(r=head_radius, steps=nose_width)[-1]
-    nose_base_r = _get_coords_on_circle(r=head_radius, steps=nose_width)[1]
+    circle_coords = _get_coords_on_circle(r=head_radius, steps=nose_width)
+    nose_base_l = circle_coords[-1]
+    nose_base_r = circle_coords[1]
     nose_tip = 1.1
     ax.plot((nose_base_l[0], 0), (nose_base_l[1], nose_tip), "k", linewidth=linewidth)
     ax.plot((nose_base_r[0], 0), (nose_base_r[1], nose_tip), "k", linewidth=linewidth)
@@ -183,18 +208,23 @@ def plot_coords(coords, scatter_kwargs={}, text_kwargs={}):
     text_settings = dict(fontsize=6)
     text_settings.update(text_kwargs)
 
+    xs = coords["x"].to_numpy()
+    ys = coords["y"].to_numpy()
+    labels = coords["label"].to_numpy()
+
     if dim == "2d":
         fig, ax = _plot_2d_head(RADIUS_INNER_CONTOUR)
-        ax.scatter(coords["x"], coords["y"], zorder=2.5, **scatter_settings)
-        for _, row in coords.iterrows():
-            ax.text(row["x"], row["y"], row["label"], **text_settings)
+        ax.scatter(xs, ys, zorder=2.5, **scatter_settings)
+        for x, y, label in zip(xs, ys, labels):
+            ax.text(x, y, label, **text_settings)
 
     else:
         assert dim == "3d"
         fig, ax = _plot_spherical_head()
 
-        for _, row in coords.iterrows():
-            ax.scatter3D(row["x"], row["y"], row["z"], **scatter_settings)
-            ax.text(row["x"], row["y"], row["z"], row["label"], **text_settings)
+        zs = coords["z"].to_numpy()
+        ax.scatter3D(xs, ys, zs, **scatter_settings)
+        for x, y, z, label in zip(xs, ys, zs, labels):
+            ax.text(x, y, z, label, **text_settings)
 
     return fig, ax
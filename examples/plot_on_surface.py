@@ -23,7 +23,6 @@ For more information, check out these MNE resources:
 # via ``pip install eeg_positions[docs]``.
 import matplotlib.pyplot as plt
 import mne
-import numpy as np
 
 from eeg_positions import get_elec_coords
 
@@ -50,8 +49,8 @@ sphere = mne.make_sphere_model(r0="auto", head_radius="auto", info=info)
 
 # We need a transform from the coordinates of our montage to the surface.
 # Given that both are spheres, we do not need to actually transform, and
-# can just use the identity transform.
-trans = mne.Transform("head", "mri", trans=np.eye(4))
+# can just use the identity transform, which MNE assumes when passing ``None``.
+trans = None
 
 fig = mne.viz.plot_alignment(
     info=info,
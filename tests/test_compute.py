@@ -7,6 +7,7 @@ import pytest
 
 from eeg_positions.compute import (
     _produce_files_and_do_x,
+    get_alias_mapping,
     get_available_elec_names,
     get_elec_coords,
 )
@@ -96,12 +97,45 @@ def test_get_elec_coords_io():
     del sys.modules["mne"]
 
 
+def test_get_elec_coords_order():
+    """Test the order of the returned coordinates."""
+    elec_names = ["Fz", "A1", "M1", "Cz", "Fz"]
+    coords = get_elec_coords(elec_names=elec_names)
+    assert coords["label"].tolist() == ["M1", "Cz", "Fz", "A1"]
+
+    coords = get_elec_coords(elec_names=elec_names, sort=True)
+    assert coords["label"].tolist() == ["A1", "Cz", "Fz", "M1"]
+
+    # the input is not modified
+    assert elec_names == ["Fz", "A1", "M1", "Cz", "Fz"]
+
+
+def test_get_elec_coords_cache():
+    """Modifying returned coordinates must not affect later calls."""
+    coords = get_elec_coords(dim="3d")
+    coords.loc[:, "x"] = 0.0
+    coords = get_elec_coords(dim="3d")
+    assert not (coords["x"] == 0.0).all()
+
+
 def test_get_available_elec_names():
     """Test get_available_elec_names."""
     match = "Unknown input for `system`: bogus"
     with pytest.raises(ValueError, match=match):
         get_available_elec_names(system="bogus")
 
+    # modifying the returned names must not affect later calls
+    elec_names = get_available_elec_names()
+    elec_names.append("bogus")
+    assert "bogus" not in get_available_elec_names()
+
+
+def test_get_alias_mapping():
+    """Modifying the returned mapping must not affect later calls."""
+    alias_mapping = get_alias_mapping()
+    alias_mapping["bogus"] = "Cz"
+    assert "bogus" not in get_alias_mapping()
+
 
 def test_produce_files_and_do_x():
     """Test the data that we ship is as expected."""
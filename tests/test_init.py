@@ -0,0 +1,39 @@
+"""Test the package namespace."""
+
+import subprocess
+import sys
+
+import pytest
+
+import eeg_positions
+
+
+def test_lazy_import():
+    """Importing the package must not import matplotlib."""
+    code = (
+        "import sys, eeg_positions; eeg_positions.config; eeg_positions.compute; "
+        "assert 'matplotlib' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_public_api():
+    """Check that the public API can be accessed."""
+    for name in eeg_positions.__all__:
+        assert callable(getattr(eeg_positions, name))
+        assert name in dir(eeg_positions)
+
+    # submodules are accessible as attributes of the package
+    for name in ("compute", "config", "utils", "viz"):
+        assert getattr(eeg_positions, name).__name__ == f"eeg_positions.{name}"
+        assert name in dir(eeg_positions)
+    assert len(eeg_positions.config.SYSTEM1005) > 0
+
+    with pytest.raises(AttributeError, match="has no attribute 'bogus'"):
+        eeg_positions.bogus
+
+
+def test_lazy_import_viz():
+    """Importing the viz module must not import matplotlib."""
+    code = "import sys, eeg_positions.viz; assert 'matplotlib' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -6,39 +6,13 @@ import pytest
 
 from eeg_positions.utils import (
     _add_points_along_contour,
-    _get_xyz,
+    _find_points_at_fractions,
+    _get_coords_on_circle,
     _stereographic_projection,
     find_point_at_fraction,
 )
 
 
-def test_get_xyz():
-    """Check whether we can get xyz coordinates."""
-    # Test the expected case
-    data = {"label": ["Cz", "Pz"], "x": [1, 2], "y": [2, 3], "z": [3, 4]}
-    df = pd.DataFrame(data)
-    x, y, z = _get_xyz(df, "Cz")
-    assert x == 1 and y == 2 and z == 3
-    x, y, z = _get_xyz(df, "Pz")
-    assert x == 2 and y == 3 and z == 4
-
-    # Test that a non-present label is inquired
-    with pytest.raises(ValueError):
-        _get_xyz(df, "f")
-
-    # Test data frame has insufficient columns
-    with pytest.raises(ValueError):
-        data = {"elec": "[Oz]", "az": [2], "po": [1]}
-        df = pd.DataFrame(data)
-        _get_xyz(df, "Oz")
-
-    # Test there are duplicates
-    with pytest.raises(ValueError):
-        data = {"label": ["Cz", "Cz"], "x": [1, 2], "y": [2, 3], "z": [3, 4]}
-        df = pd.DataFrame(data)
-        _get_xyz(df, "f")
-
-
 def test_find_point_at_fraction():
     """Test the assumptions of the fraction point finder."""
     # Test the general assumptions for fraction 0, 1, 0.5
@@ -74,6 +48,21 @@ def test_find_point_at_fraction():
     assert point == p3
 
 
+def test_find_points_at_fractions():
+    """Test that the vectorized point finder matches the scalar version."""
+    p1 = (1.0, 0.0, 0.0)
+    p2 = (0.0, 0.7071, 0.7071)
+    p3 = (-1.0, 0.0, 0.0)
+    fracs = np.arange(21) / 20
+    points = _find_points_at_fractions(p1, p2, p3, fracs)
+    assert points.shape == (21, 3)
+    for point, frac in zip(points, fracs):
+        assert tuple(point) == find_point_at_fraction(p1, p2, p3, frac=frac)
+
+    with pytest.raises(ValueError, match="Points are either collinear"):
+        _find_points_at_fractions(p1, p1, p3, fracs)
+
+
 def test_add_points_along_contour():
     """Test _add_points_along_contour."""
     fake_contour = list(range(40))
@@ -82,6 +71,16 @@ def test_add_points_along_contour():
         _add_points_along_contour("fake_df", fake_contour)
 
 
+def test_get_coords_on_circle():
+    """Test getting points on a circle, starting at the top."""
+    coords = _get_coords_on_circle(r=2, steps=90)
+    np.testing.assert_allclose(coords, [[0, 2], [2, 0], [0, -2], [-2, 0]])
+
+    coords = _get_coords_on_circle(steps=5)
+    assert len(coords) == 72
+    assert coords[0] == [0.0, 1.0]
+
+
 def test_stereographic_projection():
     """Test the stereographic projection."""
     data = {"label": ["Cz", "Nz"], "x": [0, 0], "y": [0, 1], "z": [1, 0]}
@@ -1,14 +1,22 @@
 """Test the visualization functions."""
 
-import matplotlib
+import numpy as np
 import pandas as pd
 import pytest
 
 from eeg_positions import get_elec_coords, plot_coords
-from eeg_positions.viz import _plot_2d_head, _plot_spherical_head
+from eeg_positions.viz import _get_sphere_mesh, _plot_2d_head, _plot_spherical_head
 
-# No-display backend for tests
-matplotlib.use("agg")
+
+@pytest.fixture(autouse=True, scope="module")
+def _agg_backend():
+    """Use a no-display backend, importing matplotlib only for these tests."""
+    import matplotlib
+    import matplotlib.pyplot as plt
+
+    matplotlib.use("agg")
+    yield
+    plt.close("all")
 
 
 def test_plot_spherical_head():
@@ -16,6 +24,13 @@ def test_plot_spherical_head():
     fig, ax = _plot_spherical_head()
 
 
+def test_get_sphere_mesh():
+    """Test that the mesh lies on the unit sphere."""
+    x, y, z = _get_sphere_mesh(resolution=10)
+    assert x.shape == y.shape == z.shape == (10, 10)
+    np.testing.assert_allclose(x**2 + y**2 + z**2, 1.0)
+
+
 def test_plot_2d_head():
     """Very basic test whether calling the function throws an error."""
     fig, ax = _plot_2d_head()
@@ -34,3 +49,8 @@ def test_plot_coords():
     coords = get_elec_coords()
     fig, ax = plot_coords(coords)
     fig, ax = plot_coords(coords[["label", "x", "y"]])
+
+    # one color per electrode, also in 3D
+    coords = get_elec_coords(system="1020", dim="3d")
+    fig, ax = plot_coords(coords, scatter_kwargs={"color": ["g"] * len(coords)})
+    assert len(ax.texts) == len(coords)